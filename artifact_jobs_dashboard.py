@@ -4,28 +4,380 @@ Real-time monitoring of job statuses, errors, and trends
 """
 
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 import pymongo
 from bson import ObjectId
 from datetime import datetime, timedelta
 import pandas as pd
 import plotly.express as px
-from collections import defaultdict
-import json
+import io
+import orjson
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Load artifact type name mapping
-_artifact_types_path = os.path.join(os.path.dirname(__file__), "artifactTypes.json")
-with open(_artifact_types_path) as f:
-    ARTIFACT_TYPE_NAMES = json.load(f)
+# Streamlit re-executes this script top to bottom on every rerun, so the
+# artifact type mapping (JSON parse + ObjectId construction) lives behind
+# cache_resource: parsed once per process, every rerun gets the same dicts.
+@st.cache_resource
+def _load_artifact_types():
+    path = os.path.join(os.path.dirname(__file__), "artifactTypes.json")
+    with open(path, "rb") as f:
+        names = orjson.loads(f.read())
+    name_to_id = {v: k for k, v in names.items()}
+    oids = {k: ObjectId(k) for k in names}
+    options = ["All Types"] + list(names.values())
+    return names, name_to_id, oids, options
+
+ARTIFACT_TYPE_NAMES, ARTIFACT_NAME_TO_ID, ARTIFACT_TYPE_OIDS, ARTIFACT_TYPE_OPTIONS = _load_artifact_types()
+
+# Canonical status display order, matching the pie chart color map
+STATUS_ORDER = ["completed", "running", "failed", "unknown"]
 
 def resolve_artifact_name(art_id):
     """Resolve an artifact type ObjectId to its friendly name, or full ID if not in JSON."""
     art_id_str = str(art_id)
     return ARTIFACT_TYPE_NAMES.get(art_id_str, art_id_str)
 
+def _sanitize(value):
+    """Recursively coerce ObjectId/datetime values to strings for JSON export."""
+    if isinstance(value, dict):
+        return {k: _sanitize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_sanitize(v) for v in value]
+    if isinstance(value, (ObjectId, datetime)):
+        return str(value)
+    return value
+
+def add_artifact_name_column(df, id_col="_id"):
+    """Vectorized resolve_artifact_name: adds an 'Artifact Type' column to df."""
+    ids = df[id_col].astype(str)
+    df["Artifact Type"] = ids.map(ARTIFACT_TYPE_NAMES).fillna(ids)
+    return df
+
+@st.cache_resource
+def _get_client(mongo_uri):
+    """One MongoClient (and its connection pool) per URI, shared across reruns.
+
+    Keeps a small warm pool and enables wire compression, which matters for
+    the string-heavy error-analysis payloads. Pings once so a bad URI fails
+    here rather than mid-render.
+    """
+    client = pymongo.MongoClient(
+        mongo_uri,
+        serverSelectionTimeoutMS=5000,
+        maxPoolSize=50,
+        minPoolSize=5,
+        maxIdleTimeMS=300_000,
+        compressors="zstd",
+        retryReads=True,
+    )
+    client.admin.command("ping")
+    return client
+
+@st.cache_resource
+def _ensure_indexes(mongo_uri, db_name, collection_name):
+    """Create the indexes the dashboard pipelines rely on (no-op if they exist).
+
+    Without these every $match on createdAt/artifactTypeId/status falls back
+    to a collection scan. Cached as a resource so it runs once per server
+    process, not per rerun. Returns False when the credentials can't create
+    indexes (the usual read-only grant for a monitoring user) so callers
+    know not to rely on them — the dashboard still works, just slower.
+    """
+    collection = _get_client(mongo_uri)[db_name][collection_name]
+    try:
+        collection.create_index([("createdAt", -1), ("artifactTypeId", 1), ("status", 1)])
+        collection.create_index(
+            [("artifactTypeId", 1), ("startTime", 1)],
+            partialFilterExpression={"startTime": {"$exists": True}},
+        )
+    except pymongo.errors.OperationFailure:
+        st.warning("⚠️ Could not create indexes (read-only credentials?) — queries may be slower")
+        return False
+    return True
+
+def _to_oids(ids_tuple):
+    """Hex id strings -> ObjectIds via the import-time map (O(1) per id)."""
+    return [ARTIFACT_TYPE_OIDS.get(tid) or ObjectId(tid) for tid in ids_tuple]
+
+def _job_match(start, end, type_ids):
+    """Base filter for the job pipelines; time-only when type_ids is None."""
+    match = {"createdAt": {"$gte": start, "$lte": end}}
+    if type_ids is not None:
+        match["artifactTypeId"] = {"$in": _to_oids(type_ids)}
+    return match
+
+# Cached data fetchers: keyed on the filter inputs (hashable types only, so
+# artifact type ids travel as string tuples and become ObjectIds inside).
+# ttl matches the 30s auto-refresh cadence, so widget-toggle reruns within
+# that window skip MongoDB entirely.
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _run_panel_aggregations(mongo_uri, db_name, collection_name, start, end, type_ids, bucket_unit):
+    """Run the shared $facet pipeline powering all the main panels."""
+    collection = _get_client(mongo_uri)[db_name][collection_name]
+    match_stage = {"$match": _job_match(start, end, type_ids)}
+    # Projection pushdown: drop everything the facets don't touch right after
+    # the $match so the documents flowing through the pipeline stay small
+    project_stage = {"$project": {
+        "status": 1,
+        "createdAt": 1,
+        "artifactTypeId": 1,
+        "startTime": 1,
+        "execution.totalDuration": 1,
+        "error.name": 1,
+        "error.rootCauseMessage": 1,
+        "error.failedActivity.name": 1,
+        "inputs.name": 1,
+        "inputs.data.id": 1,
+    }}
+    facets = {
+        # Status counts (metrics + pie chart)
+        "status": [
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+        ],
+        # Avg duration (from execution.totalDuration); $gt already implies
+        # the field exists, so a single predicate is index-friendly
+        "duration": [
+            {"$match": {"execution.totalDuration": {"$gt": 0}}},
+            {"$group": {"_id": None, "avgDuration": {"$avg": "$execution.totalDuration"}}}
+        ],
+        # Avg pending time (startTime - createdAt), filtered in one $match so
+        # no intermediate pendingMs projection is materialized
+        "pending": [
+            {"$match": {
+                "startTime": {"$exists": True},
+                "$expr": {"$gt": [{"$subtract": ["$startTime", "$createdAt"]}, 0]}
+            }},
+            {"$group": {"_id": None, "avgPending": {"$avg": {"$subtract": ["$startTime", "$createdAt"]}}}}
+        ],
+        # Timeline (jobs created per hour)
+        "timeline": [
+            {"$group": {
+                "_id": {"$dateTrunc": {"date": "$createdAt", "unit": bucket_unit}},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"_id": 1}}
+        ],
+        # Failure rate per hour, reduced server-side so only one row per
+        # bucket travels back instead of one row per (hour, status) pair
+        "failureRate": [
+            {"$group": {
+                "_id": {
+                    "hour": {"$dateTrunc": {"date": "$createdAt", "unit": bucket_unit}},
+                    "status": "$status"
+                },
+                "count": {"$sum": 1}
+            }},
+            {"$group": {
+                "_id": "$_id.hour",
+                "total": {"$sum": "$count"},
+                "failed": {"$sum": {"$cond": [{"$eq": ["$_id.status", "failed"]}, "$count", 0]}}
+            }},
+            {"$sort": {"_id": 1}},
+            {"$project": {
+                "hour": "$_id",
+                "total": 1,
+                "failed": 1,
+                "rate": {"$round": [{"$multiply": [{"$divide": ["$failed", {"$max": ["$total", 1]}]}, 100]}, 1]}
+            }}
+        ],
+        # Average duration over time
+        "durationOverTime": [
+            {"$match": {"execution.totalDuration": {"$gt": 0}}},
+            {"$group": {
+                "_id": {"$dateTrunc": {"date": "$createdAt", "unit": bucket_unit}},
+                "avgDuration": {"$avg": "$execution.totalDuration"},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"_id": 1}}
+        ],
+        # Jobs started per hour
+        "started": [
+            {"$match": {"startTime": {"$exists": True}}},
+            {"$group": {
+                "_id": {"$dateTrunc": {"date": "$startTime", "unit": bucket_unit}},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"_id": 1}}
+        ],
+        # Currently pending jobs by creation hour
+        "pendingNow": [
+            {"$match": {"status": "pending"}},
+            {"$group": {
+                "_id": {"$dateTrunc": {"date": "$createdAt", "unit": bucket_unit}},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"_id": 1}}
+        ],
+        # All jobs by artifact type
+        "allByType": [
+            {"$group": {
+                "_id": "$artifactTypeId",
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"count": -1}},
+            {"$limit": 15}
+        ],
+        # Pending time by artifact type
+        "pendingByType": [
+            {"$match": {
+                "startTime": {"$exists": True},
+                "$expr": {"$gt": [{"$subtract": ["$startTime", "$createdAt"]}, 0]}
+            }},
+            {"$group": {
+                "_id": "$artifactTypeId",
+                "avgPending": {"$avg": {"$subtract": ["$startTime", "$createdAt"]}},
+                "maxPending": {"$max": {"$subtract": ["$startTime", "$createdAt"]}},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"avgPending": -1}},
+            {"$limit": 15}
+        ],
+        # Avg jobs per shot by artifact type
+        "jobsPerShot": [
+            {"$unwind": "$inputs"},
+            {"$match": {"inputs.name": "inputShot"}},
+            {"$group": {
+                "_id": {"artifactTypeId": "$artifactTypeId", "shotId": "$inputs.data.id"},
+                "jobCount": {"$sum": 1}
+            }},
+            {"$group": {
+                "_id": "$_id.artifactTypeId",
+                "avgJobsPerShot": {"$avg": "$jobCount"},
+                "totalShots": {"$sum": 1}
+            }},
+            {"$sort": {"avgJobsPerShot": -1}},
+            {"$limit": 15}
+        ],
+    }
+    # allowDiskUse guards the grouping facets against skewed windows
+    return list(collection.aggregate(
+        [match_stage, project_stage, {"$facet": facets}], allowDiskUse=True
+    ))[0]
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _run_failed_aggregations(mongo_uri, db_name, collection_name, start, end, type_ids, use_hint):
+    """Facet pipeline for the error-analysis panels.
+
+    The four failed-job aggregations share the same status prefilter, so they
+    run as one scan. Only called once the status counts show failures exist.
+    """
+    collection = _get_client(mongo_uri)[db_name][collection_name]
+    pipeline = [
+        # Single $match so the planner targets the compound
+        # (createdAt, artifactTypeId, status) index directly
+        {"$match": {**_job_match(start, end, type_ids), "status": "failed"}},
+        {"$project": {
+            "artifactTypeId": 1,
+            "error.name": 1,
+            "error.rootCauseMessage": 1,
+            "error.failedActivity.name": 1,
+        }},
+        {"$facet": {
+            # Error categorization (root vs cascade)
+            "byCat": [
+                {"$group": {
+                    "_id": {"$cond": [
+                        {"$eq": ["$error.name", "ChildWorkflowFailure"]},
+                        "cascade",
+                        "root"
+                    ]},
+                    "count": {"$sum": 1}
+                }}
+            ],
+            # Top root cause messages: truncate to the group key first so the
+            # hash table holds short docs, then $sortByCount for the top N
+            "rootCauses": [
+                {"$match": {"error.name": {"$ne": "ChildWorkflowFailure"}}},
+                {"$project": {"cause": {"$substrCP": [
+                    {"$ifNull": ["$error.rootCauseMessage", "Unknown"]},
+                    0, 100
+                ]}}},
+                {"$sortByCount": "$cause"},
+                {"$limit": 10}
+            ],
+            # Failed activity names
+            "activities": [
+                {"$match": {"error.name": {"$ne": "ChildWorkflowFailure"}}},
+                {"$project": {"activity": {"$ifNull": ["$error.failedActivity.name", "Unknown"]}}},
+                {"$sortByCount": "$activity"},
+                {"$limit": 15}
+            ],
+            # Failures by artifact type
+            "byType": [
+                {"$group": {
+                    "_id": "$artifactTypeId",
+                    "count": {"$sum": 1}
+                }},
+                {"$sort": {"count": -1}},
+                {"$limit": 15}
+            ],
+        }},
+    ]
+    # Hint pins the compound index: with a many-id $in plus the status
+    # equality the planner sometimes falls back to a single-field index.
+    # Hinting a missing index is a server error, so only do it when
+    # _ensure_indexes reported the index exists (use_hint).
+    kwargs = {"allowDiskUse": True}
+    if use_hint:
+        kwargs["hint"] = {"createdAt": -1, "artifactTypeId": 1, "status": 1}
+    return list(collection.aggregate(pipeline, **kwargs))[0]
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _run_artifact_breakdown(mongo_uri, db_name, collection_name, start, end):
+    """Per-type status counts over the time window only (ignores the type filter)."""
+    collection = _get_client(mongo_uri)[db_name][collection_name]
+    return list(collection.aggregate([
+        {"$match": {"createdAt": {"$gte": start, "$lte": end}}},
+        {"$project": {"status": 1, "artifactTypeId": 1}},
+        {"$group": {
+            "_id": "$artifactTypeId",
+            "total": {"$sum": 1},
+            "failed": {"$sum": {"$cond": [{"$eq": ["$status", "failed"]}, 1, 0]}},
+            "completed": {"$sum": {"$cond": [{"$eq": ["$status", "completed"]}, 1, 0]}}
+        }},
+        {"$sort": {"total": -1}},
+        {"$limit": 15},
+        {"$project": {
+            "total": 1, "failed": 1, "completed": 1,
+            "failureRate": {"$round": [
+                {"$multiply": [{"$divide": ["$failed", {"$max": ["$total", 1]}]}, 100]}, 1
+            ]}
+        }}
+    ]))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_recent_jobs(mongo_uri, db_name, collection_name, start, end, type_ids, after=None):
+    """Fetch the 50 most recent jobs, shaped server-side for the table.
+
+    When `after` is given (the newest createdAt already shown), only newer
+    documents come back; the caller merges them into its session cache.
+    """
+    collection = _get_client(mongo_uri)[db_name][collection_name]
+    match = _job_match(start, end, type_ids)
+    if after is not None:
+        match["createdAt"] = {"$gt": after, "$lte": end}
+    return list(collection.aggregate([
+        {"$match": match},
+        {"$sort": {"createdAt": -1}},
+        {"$limit": 50},
+        {"$project": {
+            "createdAt": 1, "status": 1, "artifactTypeId": 1,
+            # Truncate error messages server-side so long strings never ship.
+            # $substrCP, not $substrBytes: a byte cut can land mid-character
+            # and error the whole aggregation; code points never do
+            "error_msg": {"$cond": [
+                {"$eq": ["$status", "failed"]},
+                {"$substrCP": [{"$ifNull": ["$error.rootCauseMessage", "No message"]}, 0, 60]},
+                ""
+            ]}
+        }}
+    ], batchSize=50))
+
 # Page config
 st.set_page_config(
     page_title="Artifact Jobs Monitor",
@@ -89,6 +441,7 @@ if time_range == "Custom":
     end_date = col2.date_input("End Date", datetime.utcnow().date())
     start_datetime = datetime.combine(start_date, datetime.min.time())
     end_datetime = datetime.combine(end_date, datetime.max.time())
+    days_back = (end_datetime - start_datetime).total_seconds() / 86400
 else:
     time_ranges = {
         "Last Hour": 1/24,
@@ -98,23 +451,44 @@ else:
         "Last 30 Days": 30
     }
     days_back = time_ranges[time_range]
-    end_datetime = datetime.utcnow()
+    # Floor "now" to the 30s refresh cadence so the cached fetcher keys stay
+    # stable between auto-refresh ticks instead of changing on every rerun
+    _now = datetime.utcnow()
+    end_datetime = _now.replace(second=_now.second - _now.second % 30, microsecond=0)
     start_datetime = end_datetime - timedelta(days=days_back)
 
+# Adaptive bucket size so short ranges get detail and long ranges don't
+# ship hundreds of thin bars back from Mongo
+if days_back <= 1/24:
+    bucket_unit = "minute"
+elif days_back <= 7:
+    bucket_unit = "hour"
+else:
+    bucket_unit = "day"
+bucket_label = bucket_unit.capitalize()
+
 # Artifact type filter
-_type_options = ["All Types"] + list(ARTIFACT_TYPE_NAMES.values())
-selected_type_name = st.sidebar.selectbox("Artifact Type", _type_options)
+selected_type_name = st.sidebar.selectbox("Artifact Type", ARTIFACT_TYPE_OPTIONS)
 
+# None means no artifactTypeId filter at all: "All Types" then matches on the
+# time range alone (a plain createdAt index scan, no large $in post-filter)
+# and includes jobs whose type isn't in artifactTypes.json
 if selected_type_name == "All Types":
-    _selected_type_ids = list(ARTIFACT_TYPE_NAMES.keys())
+    selected_type_ids = None
 else:
-    _selected_type_ids = [k for k, v in ARTIFACT_TYPE_NAMES.items() if v == selected_type_name]
+    # Guard against name/id drift in artifactTypes.json: without an id the
+    # filter would match nothing, so stop before firing any queries
+    _selected_id = ARTIFACT_NAME_TO_ID.get(selected_type_name)
+    if _selected_id is None:
+        st.warning(f"⚠️ No artifact type id found for '{selected_type_name}' — check artifactTypes.json")
+        st.stop()
+    selected_type_ids = (_selected_id,)
 
-selected_type_oids = [ObjectId(tid) for tid in _selected_type_ids]
-
-# Auto-refresh
+# Auto-refresh: the component schedules reruns from the browser, so the
+# script thread is never blocked in a sleep
 auto_refresh = st.sidebar.checkbox("Auto-refresh (30s)", value=False)
 if auto_refresh:
+    st_autorefresh(interval=30_000, key="autorefresh")
     st.sidebar.info("Dashboard will refresh every 30 seconds")
 
 # Connect button
@@ -123,43 +497,79 @@ connect_button = st.sidebar.button("🔌 Connect to MongoDB", type="primary")
 # Initialize session state
 if 'connected' not in st.session_state:
     st.session_state.connected = False
-if 'client' not in st.session_state:
-    st.session_state.client = None
 
 # Connection logic
 if connect_button or st.session_state.connected:
     try:
         if not st.session_state.connected or connect_button:
             with st.spinner("Connecting to MongoDB..."):
-                client = pymongo.MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
-                # Test connection
-                client.server_info()
-                st.session_state.client = client
+                # The cached resource pings on creation, so this validates the URI
+                _get_client(mongo_uri)
                 st.session_state.connected = True
                 st.sidebar.success("✅ Connected!")
-        
-        client = st.session_state.client
-        db = client[db_name]
-        collection = db[collection_name]
+
+        collection = _get_client(mongo_uri)[db_name][collection_name]
+        indexes_ok = _ensure_indexes(mongo_uri, db_name, collection_name)
         
         # Main dashboard
         st.title("Artifact Jobs Monitoring Dashboard")
         st.markdown(f"**Time Range:** {start_datetime.strftime('%Y-%m-%d %H:%M')} to {end_datetime.strftime('%Y-%m-%d %H:%M')}")
         
-        # Shared match stage for all aggregations
-        base_filter = {
-            "createdAt": {"$gte": start_datetime, "$lte": end_datetime},
-            "artifactTypeId": {"$in": selected_type_oids},
-        }
-        match_stage = {"$match": base_filter}
-        
-        # --- Aggregation: Status counts (metrics + pie chart) ---
+        # Shared base filter (export query); the cached fetchers rebuild it
+        base_filter = _job_match(start_datetime, end_datetime, selected_type_ids)
+
+        # Empty-collection fast path for the widest filter: an O(1) metadata
+        # read beats scanning 30 days just to learn there is nothing there
+        if selected_type_ids is None and days_back >= 30:
+            if collection.estimated_document_count() == 0:
+                st.warning("⚠️ No jobs found in this collection")
+                st.stop()
+
+        # Watermark cache for the recent-jobs table: while the filters are
+        # unchanged, only ask Mongo for documents newer than the newest one
+        # already shown and merge them into the session copy (capped at 50)
+        _recent_key = (db_name, collection_name, selected_type_ids, time_range,
+                       (start_datetime, end_datetime) if time_range == "Custom" else days_back)
+        _recent_cache = st.session_state.get("recent_jobs_cache")
+        if _recent_cache is not None and _recent_cache["key"] != _recent_key:
+            _recent_cache = None
+        _recent_after = _recent_cache["last_seen"] if _recent_cache else None
+
         with st.spinner("Loading data..."):
-            status_agg = list(collection.aggregate([
-                match_stage,
-                {"$group": {"_id": "$status", "count": {"$sum": 1}}}
-            ]))
-            
+            # The three fetchers run disjoint pipelines, so on a cold cache
+            # overlap their round trips instead of paying them serially
+            with ThreadPoolExecutor(max_workers=3) as _pool:
+                _panel_future = _pool.submit(
+                    _run_panel_aggregations,
+                    mongo_uri, db_name, collection_name,
+                    start_datetime, end_datetime, selected_type_ids,
+                    bucket_unit,
+                )
+                _breakdown_future = _pool.submit(
+                    _run_artifact_breakdown,
+                    mongo_uri, db_name, collection_name,
+                    start_datetime, end_datetime,
+                ) if selected_type_name == "All Types" else None
+                _recent_future = _pool.submit(
+                    _fetch_recent_jobs,
+                    mongo_uri, db_name, collection_name,
+                    start_datetime, end_datetime, selected_type_ids,
+                    _recent_after,
+                )
+                facet_result = _panel_future.result()
+
+            status_agg = facet_result["status"]
+            duration_agg = facet_result["duration"]
+            pending_agg = facet_result["pending"]
+            timeline_agg = facet_result["timeline"]
+            failure_rate_agg = facet_result["failureRate"]
+            duration_over_time_agg = facet_result["durationOverTime"]
+            started_agg = facet_result["started"]
+            pending_now_agg = facet_result["pendingNow"]
+            all_by_type_agg = facet_result["allByType"]
+            pending_by_type_agg = facet_result["pendingByType"]
+            jobs_per_shot_agg = facet_result["jobsPerShot"]
+
             status_counts = {doc["_id"] or "unknown": doc["count"] for doc in status_agg}
             total_jobs = sum(status_counts.values())
             
@@ -169,30 +579,28 @@ if connect_button or st.session_state.connected:
             
             failed_count = status_counts.get("failed", 0)
             completed_count = status_counts.get("completed", 0)
-            failure_rate = (failed_count / total_jobs * 100) if total_jobs > 0 else 0
-            success_rate = (completed_count / total_jobs * 100) if total_jobs > 0 else 0
-            
+            # total_jobs > 0 past the st.stop() above, so no guard needed
+            failure_rate = failed_count / total_jobs * 100
+
+            # Built once here; the status pie below reuses it as-is. The
+            # fixed category order keeps legend/colors stable across reruns
+            # so Plotly doesn't re-infer ordering (and the frontend doesn't
+            # repaint a reshuffled legend) every refresh.
+            _status_order = [s for s in STATUS_ORDER if s in status_counts]
+            _status_order += [s for s in status_counts if s not in STATUS_ORDER]
+            status_df = pd.DataFrame({
+                'Status': pd.Categorical(list(status_counts), categories=_status_order, ordered=True),
+                'Count': list(status_counts.values())
+            }).astype({'Count': 'int32'}).sort_values('Status')
+
+
             st.success(f"✅ Found {total_jobs:,} jobs in range")
         
-        # --- Aggregation: Avg duration (from execution.totalDuration) ---
-        duration_agg = list(collection.aggregate([
-            match_stage,
-            {"$match": {
-                "execution.totalDuration": {"$exists": True, "$gt": 0},
-            }},
-            {"$group": {"_id": None, "avgDuration": {"$avg": "$execution.totalDuration"}, "count": {"$sum": 1}}}
-        ]))
+        # Avg duration (from execution.totalDuration)
         avg_time = duration_agg[0]["avgDuration"] if duration_agg else 0
         avg_time = avg_time or 0
-        
-        # --- Aggregation: Avg pending time (startTime - createdAt) ---
-        pending_agg = list(collection.aggregate([
-            match_stage,
-            {"$match": {"startTime": {"$exists": True}}},
-            {"$project": {"pendingMs": {"$subtract": ["$startTime", "$createdAt"]}}},
-            {"$match": {"pendingMs": {"$gt": 0}}},
-            {"$group": {"_id": None, "avgPending": {"$avg": "$pendingMs"}}}
-        ]))
+
+        # Avg pending time (startTime - createdAt)
         avg_pending_ms = pending_agg[0]["avgPending"] if pending_agg else 0
         avg_pending_min = (avg_pending_ms or 0) / 1000 / 60
         
@@ -225,48 +633,24 @@ if connect_button or st.session_state.connected:
         
         st.divider()
         
-        # --- Aggregation: Timeline (jobs created per hour) ---
-        timeline_agg = list(collection.aggregate([
-            match_stage,
-            {"$group": {
-                "_id": {"$dateTrunc": {"date": "$createdAt", "unit": "hour"}},
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"_id": 1}}
-        ]))
-        
-        # --- Aggregation: Timeline by status (for failure rate / pending charts) ---
-        timeline_by_status_agg = list(collection.aggregate([
-            match_stage,
-            {"$group": {
-                "_id": {
-                    "hour": {"$dateTrunc": {"date": "$createdAt", "unit": "hour"}},
-                    "status": "$status"
-                },
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"_id.hour": 1}}
-        ]))
-        
         # Two column layout
         col_left, col_right = st.columns([2, 1])
         
         with col_left:
-            st.subheader("Jobs Created Per Hour")
+            st.subheader(f"Jobs Created Per {bucket_label}")
             
             if timeline_agg:
-                timeline_data = [{
-                    "hour": doc["_id"],
-                    "count": doc["count"]
-                } for doc in timeline_agg]
-                
-                df_timeline = pd.DataFrame(timeline_data)
+                df_timeline = (
+                    pd.DataFrame.from_records(timeline_agg)
+                    .rename(columns={"_id": "hour"})
+                    .astype({"count": "int32"})
+                )
                 
                 fig_timeline = px.bar(
                     df_timeline,
                     x='hour',
                     y='count',
-                    title='Jobs Created Per Hour',
+                    title=f'Jobs Created Per {bucket_label}',
                     labels={'hour': 'Time', 'count': 'Jobs Created'}
                 )
                 fig_timeline.update_traces(marker_color='#1565c0')
@@ -275,48 +659,31 @@ if connect_button or st.session_state.connected:
         
         with col_right:
             st.subheader("Status Distribution")
-            
-            status_df = pd.DataFrame([
-                {'Status': k, 'Count': v} for k, v in status_counts.items()
-            ])
-            
+
             fig_pie = px.pie(
                 status_df,
                 values='Count',
                 names='Status',
                 color='Status',
-                color_discrete_map={'completed': '#00c853', 'failed': '#d32f2f', 'running': '#ff6f00'}
+                color_discrete_map={'completed': '#00c853', 'failed': '#d32f2f', 'running': '#ff6f00'},
+                category_orders={'Status': _status_order}
             )
             fig_pie.update_layout(height=400)
             st.plotly_chart(fig_pie, use_container_width=True)
         
         # --- Failure rate over time ---
-        if timeline_by_status_agg:
+        if failure_rate_agg:
             st.subheader("Failure Rate Over Time")
-            
-            hourly_totals = defaultdict(lambda: {"total": 0, "failed": 0})
-            for doc in timeline_by_status_agg:
-                hour = doc["_id"]["hour"]
-                status = doc["_id"]["status"] or "unknown"
-                count = doc["count"]
-                hourly_totals[hour]["total"] += count
-                if status == "failed":
-                    hourly_totals[hour]["failed"] += count
-            
-            failure_rate_data = [{
-                "hour": hour,
-                "Failure Rate %": round(counts["failed"] / counts["total"] * 100, 1) if counts["total"] > 0 else 0,
-                "Total Jobs": counts["total"],
-                "Failed": counts["failed"]
-            } for hour, counts in sorted(hourly_totals.items())]
-            
-            df_failure_rate = pd.DataFrame(failure_rate_data)
+
+            df_failure_rate = pd.DataFrame(failure_rate_agg).rename(columns={
+                "rate": "Failure Rate %", "total": "Total Jobs", "failed": "Failed"
+            })
             
             fig_failure_rate = px.line(
                 df_failure_rate,
                 x="hour",
                 y="Failure Rate %",
-                title="Failure Rate % by Hour",
+                title=f"Failure Rate % by {bucket_label}",
                 labels={"hour": "Time"},
                 markers=True,
             )
@@ -325,17 +692,6 @@ if connect_button or st.session_state.connected:
             st.plotly_chart(fig_failure_rate, use_container_width=True)
         
         # --- Average Duration Over Time ---
-        duration_over_time_agg = list(collection.aggregate([
-            match_stage,
-            {"$match": {"execution.totalDuration": {"$exists": True, "$gt": 0}}},
-            {"$group": {
-                "_id": {"$dateTrunc": {"date": "$createdAt", "unit": "hour"}},
-                "avgDuration": {"$avg": "$execution.totalDuration"},
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"_id": 1}}
-        ]))
-        
         if duration_over_time_agg:
             st.subheader("Average Duration Over Time")
             
@@ -351,7 +707,7 @@ if connect_button or st.session_state.connected:
                 df_duration_time,
                 x="hour",
                 y="Avg Duration (min)",
-                title="Avg Duration by Hour (minutes)",
+                title=f"Avg Duration by {bucket_label} (minutes)",
                 labels={"hour": "Time"},
                 markers=True,
             )
@@ -360,23 +716,16 @@ if connect_button or st.session_state.connected:
             st.plotly_chart(fig_duration_time, use_container_width=True)
         
         # --- Jobs Started Per Hour ---
-        started_agg = list(collection.aggregate([
-            match_stage,
-            {"$match": {"startTime": {"$exists": True}}},
-            {"$group": {
-                "_id": {"$dateTrunc": {"date": "$startTime", "unit": "hour"}},
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"_id": 1}}
-        ]))
-        
         if started_agg:
-            st.subheader("Jobs Started Per Hour")
-            started_data = [{"hour": doc["_id"], "count": doc["count"]} for doc in started_agg]
-            df_started = pd.DataFrame(started_data)
+            st.subheader(f"Jobs Started Per {bucket_label}")
+            df_started = (
+                pd.DataFrame.from_records(started_agg)
+                .rename(columns={"_id": "hour"})
+                .astype({"count": "int32"})
+            )
             fig_started = px.bar(
                 df_started, x="hour", y="count",
-                title="Jobs Started Per Hour",
+                title=f"Jobs Started Per {bucket_label}",
                 labels={"hour": "Time", "count": "Jobs Started"},
             )
             fig_started.update_traces(marker_color="#00c853")
@@ -384,20 +733,13 @@ if connect_button or st.session_state.connected:
             st.plotly_chart(fig_started, use_container_width=True)
         
         # --- Currently Pending Jobs by Creation Hour ---
-        pending_now_agg = list(collection.aggregate([
-            match_stage,
-            {"$match": {"status": "pending"}},
-            {"$group": {
-                "_id": {"$dateTrunc": {"date": "$createdAt", "unit": "hour"}},
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"_id": 1}}
-        ]))
-        
         if pending_now_agg:
             st.subheader("Currently Pending Jobs (by creation time)")
-            pending_now_data = [{"hour": doc["_id"], "count": doc["count"]} for doc in pending_now_agg]
-            df_pending_now = pd.DataFrame(pending_now_data)
+            df_pending_now = (
+                pd.DataFrame.from_records(pending_now_agg)
+                .rename(columns={"_id": "hour"})
+                .astype({"count": "int32"})
+            )
             fig_pending_now = px.bar(
                 df_pending_now, x="hour", y="count",
                 title="Currently Pending Jobs by Creation Hour",
@@ -411,21 +753,18 @@ if connect_button or st.session_state.connected:
         if failed_count > 0:
             st.divider()
             st.subheader("Error Analysis")
-            
-            # Aggregation: error categorization (root vs cascade)
-            error_cat_agg = list(collection.aggregate([
-                match_stage,
-                {"$match": {"status": "failed"}},
-                {"$group": {
-                    "_id": {"$cond": [
-                        {"$eq": ["$error.name", "ChildWorkflowFailure"]},
-                        "cascade",
-                        "root"
-                    ]},
-                    "count": {"$sum": 1}
-                }}
-            ]))
-            
+
+            failed_facets = _run_failed_aggregations(
+                mongo_uri, db_name, collection_name,
+                start_datetime, end_datetime, selected_type_ids,
+                use_hint=indexes_ok,
+            )
+            error_cat_agg = failed_facets["byCat"]
+            root_cause_agg = failed_facets["rootCauses"]
+            activity_agg = failed_facets["activities"]
+            failed_by_type_agg = failed_facets["byType"]
+
+            # Error categorization (root vs cascade)
             error_cats = {doc["_id"]: doc["count"] for doc in error_cat_agg}
             root_error_count = error_cats.get("root", 0)
             child_failure_count = error_cats.get("cascade", 0)
@@ -440,22 +779,7 @@ if connect_button or st.session_state.connected:
             
             with col_err_left:
                 st.subheader("Top Root Causes")
-                
-                # Aggregation: top root cause messages
-                root_cause_agg = list(collection.aggregate([
-                    match_stage,
-                    {"$match": {"status": "failed", "error.name": {"$ne": "ChildWorkflowFailure"}}},
-                    {"$group": {
-                        "_id": {"$substrBytes": [
-                            {"$ifNull": ["$error.rootCauseMessage", "Unknown"]},
-                            0, 100
-                        ]},
-                        "count": {"$sum": 1}
-                    }},
-                    {"$sort": {"count": -1}},
-                    {"$limit": 10}
-                ]))
-                
+
                 if root_cause_agg:
                     cause_df = pd.DataFrame([{
                         "Cause": doc["_id"][:60] + "..." if len(doc["_id"]) > 60 else doc["_id"],
@@ -471,19 +795,7 @@ if connect_button or st.session_state.connected:
             
             with col_err_right:
                 st.subheader("Failed Activities")
-                
-                # Aggregation: failed activity names
-                activity_agg = list(collection.aggregate([
-                    match_stage,
-                    {"$match": {"status": "failed", "error.name": {"$ne": "ChildWorkflowFailure"}}},
-                    {"$group": {
-                        "_id": {"$ifNull": ["$error.failedActivity.name", "Unknown"]},
-                        "count": {"$sum": 1}
-                    }},
-                    {"$sort": {"count": -1}},
-                    {"$limit": 15}
-                ]))
-                
+
                 if activity_agg:
                     activity_df = pd.DataFrame([{
                         "Activity": doc["_id"],
@@ -504,25 +816,11 @@ if connect_button or st.session_state.connected:
                 
                 with col_all_types:
                     st.subheader("All Jobs by Artifact Type")
-                    
-                    all_by_type_agg = list(collection.aggregate([
-                        match_stage,
-                        {"$group": {
-                            "_id": "$artifactTypeId",
-                            "count": {"$sum": 1}
-                        }},
-                        {"$sort": {"count": -1}},
-                        {"$limit": 15}
-                    ]))
-                    
+
                     if all_by_type_agg:
-                        all_type_data = [{
-                            "Artifact Type": resolve_artifact_name(doc["_id"]),
-                            "Jobs": doc["count"]
-                        } for doc in all_by_type_agg]
-                        
-                        all_type_df = pd.DataFrame(all_type_data)
-                        
+                        all_type_df = add_artifact_name_column(pd.DataFrame(all_by_type_agg))
+                        all_type_df = all_type_df.rename(columns={"count": "Jobs"})
+
                         fig_all_types = px.pie(
                             all_type_df,
                             values='Jobs',
@@ -534,26 +832,11 @@ if connect_button or st.session_state.connected:
                 
                 with col_failed_types:
                     st.subheader("Failures by Artifact Type")
-                    
-                    failed_by_type_agg = list(collection.aggregate([
-                        match_stage,
-                        {"$match": {"status": "failed"}},
-                        {"$group": {
-                            "_id": "$artifactTypeId",
-                            "count": {"$sum": 1}
-                        }},
-                        {"$sort": {"count": -1}},
-                        {"$limit": 15}
-                    ]))
-                    
+
                     if failed_by_type_agg:
-                        failed_type_data = [{
-                            "Artifact Type": resolve_artifact_name(doc["_id"]),
-                            "Failed Jobs": doc["count"]
-                        } for doc in failed_by_type_agg]
-                        
-                        failed_type_df = pd.DataFrame(failed_type_data)
-                        
+                        failed_type_df = add_artifact_name_column(pd.DataFrame(failed_by_type_agg))
+                        failed_type_df = failed_type_df.rename(columns={"count": "Failed Jobs"})
+
                         fig_failed_types = px.pie(
                             failed_type_df,
                             values='Failed Jobs',
@@ -568,75 +851,27 @@ if connect_button or st.session_state.connected:
             st.divider()
             st.subheader("Artifact Types")
             
-            # Use time-only filter so we see all artifact types in data, not just those in JSON
-            match_time_only = {"$match": {"createdAt": {"$gte": start_datetime, "$lte": end_datetime}}}
-            artifact_agg = list(collection.aggregate([
-                match_time_only,
-                {"$group": {
-                    "_id": {"artifactTypeId": "$artifactTypeId", "status": "$status"},
-                    "count": {"$sum": 1}
-                }}
-            ]))
-            
-            artifact_types = defaultdict(lambda: {'total': 0, 'failed': 0, 'completed': 0})
-            for doc in artifact_agg:
-                art_id = str(doc["_id"]["artifactTypeId"])
-                art_name = resolve_artifact_name(art_id)
-                status = doc["_id"]["status"] or "unknown"
-                count = doc["count"]
-                artifact_types[art_name]['total'] += count
-                if status == 'failed':
-                    artifact_types[art_name]['failed'] += count
-                elif status == 'completed':
-                    artifact_types[art_name]['completed'] += count
-            
-            artifact_list = []
-            for art_name, counts in artifact_types.items():
-                fr = (counts['failed'] / counts['total'] * 100) if counts['total'] > 0 else 0
-                artifact_list.append({
-                    'Artifact Type': art_name,
-                    'Total Jobs': counts['total'],
-                    'Failed': counts['failed'],
-                    'completed': counts['completed'],
-                    'Failure Rate %': round(fr, 1)
-                })
-            
-            artifact_df = pd.DataFrame(artifact_list).sort_values('Total Jobs', ascending=False)
+            # Time-only filter so we see all artifact types in data, not just
+            # those in JSON; kicked off alongside the main panel fetch above
+            artifact_agg = _breakdown_future.result()
             
-            st.dataframe(artifact_df.head(15), use_container_width=True, hide_index=True)
+            artifact_df = add_artifact_name_column(pd.DataFrame(artifact_agg))
+            artifact_df = artifact_df.rename(columns={
+                'total': 'Total Jobs', 'failed': 'Failed', 'failureRate': 'Failure Rate %'
+            })[['Artifact Type', 'Total Jobs', 'Failed', 'completed', 'Failure Rate %']]
+
+            st.dataframe(artifact_df, use_container_width=True, hide_index=True)
         
         # --- Pending time by artifact type ---
         st.divider()
         st.subheader("Avg Pending Time by Artifact Type")
-        
-        pending_by_type_agg = list(collection.aggregate([
-            match_stage,
-            {"$match": {"startTime": {"$exists": True}}},
-            {"$project": {
-                "artifactTypeId": 1,
-                "pendingMs": {"$subtract": ["$startTime", "$createdAt"]}
-            }},
-            {"$match": {"pendingMs": {"$gt": 0}}},
-            {"$group": {
-                "_id": "$artifactTypeId",
-                "avgPending": {"$avg": "$pendingMs"},
-                "maxPending": {"$max": "$pendingMs"},
-                "count": {"$sum": 1}
-            }},
-            {"$sort": {"avgPending": -1}},
-            {"$limit": 15}
-        ]))
-        
+
         if pending_by_type_agg:
-            pending_type_data = [{
-                "Artifact Type": resolve_artifact_name(doc["_id"]),
-                "Avg Pending (min)": round(doc["avgPending"] / 1000 / 60, 1),
-                "Max Pending (min)": round(doc["maxPending"] / 1000 / 60, 1),
-                "Jobs": doc["count"]
-            } for doc in pending_by_type_agg]
-            
-            pending_type_df = pd.DataFrame(pending_type_data)
-            
+            pending_type_df = add_artifact_name_column(pd.DataFrame(pending_by_type_agg))
+            pending_type_df["Avg Pending (min)"] = (pending_type_df["avgPending"] / 1000 / 60).round(1)
+            pending_type_df["Max Pending (min)"] = (pending_type_df["maxPending"] / 1000 / 60).round(1)
+            pending_type_df = pending_type_df.rename(columns={"count": "Jobs"})
+
             fig_pending = px.bar(
                 pending_type_df,
                 x="Avg Pending (min)",
@@ -645,7 +880,7 @@ if connect_button or st.session_state.connected:
                 title="Avg Pending Time by Artifact Type (minutes)",
                 hover_data=["Max Pending (min)", "Jobs"],
             )
-            fig_pending.update_layout(height=max(300, len(pending_type_data) * 35 + 100))
+            fig_pending.update_layout(height=max(300, len(pending_type_df) * 35 + 100))
             st.plotly_chart(fig_pending, use_container_width=True)
         else:
             st.info("No pending time data available (jobs missing startTime)")
@@ -653,33 +888,12 @@ if connect_button or st.session_state.connected:
         # --- Avg Jobs Per Shot by Artifact Type ---
         st.divider()
         st.subheader("Avg Jobs Per Shot by Artifact Type")
-        
-        jobs_per_shot_agg = list(collection.aggregate([
-            match_stage,
-            {"$unwind": "$inputs"},
-            {"$match": {"inputs.name": "inputShot"}},
-            {"$group": {
-                "_id": {"artifactTypeId": "$artifactTypeId", "shotId": "$inputs.data.id"},
-                "jobCount": {"$sum": 1}
-            }},
-            {"$group": {
-                "_id": "$_id.artifactTypeId",
-                "avgJobsPerShot": {"$avg": "$jobCount"},
-                "totalShots": {"$sum": 1}
-            }},
-            {"$sort": {"avgJobsPerShot": -1}},
-            {"$limit": 15}
-        ]))
-        
+
         if jobs_per_shot_agg:
-            jps_data = [{
-                "Artifact Type": resolve_artifact_name(doc["_id"]),
-                "Avg Jobs Per Shot": round(doc["avgJobsPerShot"], 1),
-                "Total Shots": doc["totalShots"]
-            } for doc in jobs_per_shot_agg]
-            
-            jps_df = pd.DataFrame(jps_data)
-            
+            jps_df = add_artifact_name_column(pd.DataFrame(jobs_per_shot_agg))
+            jps_df["Avg Jobs Per Shot"] = jps_df["avgJobsPerShot"].round(1)
+            jps_df = jps_df.rename(columns={"totalShots": "Total Shots"})
+
             fig_jps = px.bar(
                 jps_df,
                 x="Avg Jobs Per Shot",
@@ -688,7 +902,7 @@ if connect_button or st.session_state.connected:
                 title="Avg Jobs Per Shot by Artifact Type",
                 hover_data=["Total Shots"],
             )
-            fig_jps.update_layout(height=max(300, len(jps_data) * 35 + 100))
+            fig_jps.update_layout(height=max(300, len(jps_df) * 35 + 100))
             st.plotly_chart(fig_jps, use_container_width=True)
         else:
             st.info("No shot data available (jobs missing inputShot)")
@@ -697,39 +911,26 @@ if connect_button or st.session_state.connected:
         st.divider()
         st.subheader("Recent Jobs")
         
-        recent_projection = {
-            "status": 1, "createdAt": 1,
-            "artifactTypeId": 1,
-            "error.rootCauseMessage": 1,
+        _fresh_jobs = _recent_future.result()
+        if _recent_cache is not None:
+            recent_jobs = (_fresh_jobs + _recent_cache["jobs"])[:50]
+        else:
+            recent_jobs = _fresh_jobs
+        st.session_state.recent_jobs_cache = {
+            "key": _recent_key,
+            "jobs": recent_jobs,
+            # Docs arrive newest-first, so the head carries the watermark
+            "last_seen": recent_jobs[0]["createdAt"] if recent_jobs else _recent_after,
         }
-        recent_jobs = list(
-            collection.find(
-                base_filter,
-                recent_projection
-            ).sort("createdAt", -1).limit(50)
-        )
         
-        recent_list = []
-        for job in recent_jobs:
-            job_id_str = str(job.get('_id', ''))
-            created = job.get('createdAt')
-            created_str = str(created)[:19] if created else 'Unknown'
-            status = job.get('status', 'unknown')
-            artifact_type = resolve_artifact_name(job.get('artifactTypeId', ''))
-            error_msg = ''
-            if status == 'failed':
-                error_msg = (job.get('error', {}) or {}).get('rootCauseMessage', 'No message')
-                error_msg = error_msg[:60] if error_msg else 'No message'
-            
-            recent_list.append({
-                'Job ID': job_id_str,
-                'Created': created_str,
-                'Artifact Type': artifact_type,
-                'Status': status,
-                'Error': error_msg
-            })
-        
-        recent_df = pd.DataFrame(recent_list)
+        recent_df = pd.DataFrame(recent_jobs)
+        if not recent_df.empty:
+            recent_df['Job ID'] = recent_df['_id'].astype(str)
+            recent_df['Created'] = recent_df['createdAt'].astype(str).str[:19]
+            _type_strs = recent_df['artifactTypeId'].astype(str)
+            recent_df['Artifact Type'] = _type_strs.map(ARTIFACT_TYPE_NAMES).fillna(_type_strs)
+            recent_df = recent_df.rename(columns={'status': 'Status', 'error_msg': 'Error'})
+            recent_df = recent_df[['Job ID', 'Created', 'Artifact Type', 'Status', 'Error']]
         st.dataframe(recent_df, use_container_width=True, hide_index=True)
         
         # Export section
@@ -749,45 +950,49 @@ if connect_button or st.session_state.connected:
                 if omit_cascading:
                     export_query["error.name"] = {"$ne": "ChildWorkflowFailure"}
                 
+                # Large batches keep getMore round trips low for the export
                 failed_cursor = collection.find(
                     export_query,
-                    export_projection
+                    export_projection,
+                    batch_size=1000
                 ).sort("createdAt", -1).limit(5000)
                 
-                failed_list = []
-                for job in failed_cursor:
+                # Stream the cursor straight into a buffer so we never hold
+                # both a 5000-doc list and its serialized string in memory
+                export_buf = io.BytesIO()
+                export_buf.write(b"[")
+                for i, job in enumerate(failed_cursor):
                     error_data = job.get('error', {}) or {}
                     # Truncate rootCauseMessage to 200 chars
                     if 'rootCauseMessage' in error_data and error_data['rootCauseMessage']:
                         error_data['rootCauseMessage'] = error_data['rootCauseMessage'][:200]
-                    
-                    failed_list.append({
+
+                    doc = {
                         '_id': str(job.get('_id', '')),
                         'createdAt': str(job.get('createdAt', '')),
                         'status': job.get('status'),
                         'artifactTypeId': str(job.get('artifactTypeId', '')),
                         'artifactTypeName': resolve_artifact_name(job.get('artifactTypeId', '')),
-                        'error': json.loads(json.dumps(error_data, default=str))
-                    })
-                
-                failed_export = json.dumps(failed_list, indent=2)
-                
+                        'error': _sanitize(error_data)
+                    }
+                    if i > 0:
+                        export_buf.write(b",\n")
+                    # default=str keeps json.dumps' old safety net for BSON
+                    # types _sanitize doesn't cover (Decimal128, Binary, ...)
+                    export_buf.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2, default=str))
+                export_buf.write(b"]")
+                export_buf.seek(0)
+
                 st.download_button(
                     label="Download failed_jobs.json",
-                    data=failed_export,
+                    data=export_buf,
                     file_name=f"failed_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                     mime="application/json"
                 )
         
         with col_export2:
             st.info(f"Last updated: {datetime.now().strftime('%H:%M:%S')} | Total jobs in range: {total_jobs:,}")
-        
-        # Auto-refresh logic
-        if auto_refresh:
-            import time
-            time.sleep(30)
-            st.rerun()
-        
+
     except pymongo.errors.ServerSelectionTimeoutError:
         st.sidebar.error("❌ Cannot connect to MongoDB. Check your URI and network connection.")
         st.session_state.connected = False